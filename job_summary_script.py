@@ -48,8 +48,10 @@ carbon_potential = '🟢 Low Impact' if metrics['carbon_footprint'] > 70 else '
 energy_potential = '✅ Optimized' if metrics['energy_efficiency'] > 70 else '⚠️ Needs Work'
 practices_potential = '🟢 Good' if metrics['sustainable_practices'] > 50 else '🔴 Poor'
 quality_gate_status = '✅ Passing' if metrics['overall_score'] >= 75 else '❌ Failing'
+generated_at = metadata['generated_at'][:19]
+analysis_time = f"{metadata['analysis_time']:.3f}"
 
-job_summary = f"""# 🌱 Comprehensive Sustainability Analysis Dashboard
+summary_parts = [f"""# 🌱 Comprehensive Sustainability Analysis Dashboard
 
 ## Overall Score: {metrics['overall_score']:.1f}/100 {get_score_status(metrics['overall_score'])}
 
@@ -61,11 +63,11 @@ Overall Score [{overall_bar}] {metrics['overall_score']:.1f}/100
 
 | Metric | Value | Details |
 |--------|-------|---------|
-| 🔍 **Analysis Time** | **{metadata['analysis_time']:.3f}s** | Comprehensive evaluation |
+| 🔍 **Analysis Time** | **{analysis_time}s** | Comprehensive evaluation |
 | 📊 **Files Processed** | **30** | Total codebase analysis |
 | 🚨 **Issues Detected** | **{total_issues}** | Performance problems found |
 | 🌍 **Carbon Footprint** | **{metrics['carbon_footprint']:.1f}/100** | Environmental efficiency score |
-| 🕐 **Generated At** | **{metadata['generated_at'][:19]}** | Fresh comprehensive analysis |
+| 🕐 **Generated At** | **{generated_at}** | Fresh comprehensive analysis |
 
 ### 📊 Comprehensive Sustainability Metrics
 
@@ -100,7 +102,7 @@ Overall Score [{overall_bar}] {metrics['overall_score']:.1f}/100
 
 ### 💡 Priority Action Items
 
-"""
+"""]
 
 # Generate recommendations based on metrics
 recommendations = []
@@ -115,18 +117,17 @@ if metrics['carbon_footprint'] < 50:
 if metrics['maintainability'] < 60:
     recommendations.append("🟢 **Low**: Improve code maintainability for long-term sustainability")
 
-for i, rec in enumerate(recommendations, 1):
-    job_summary += f"{i}. {rec}\\n"
+summary_parts.extend(f"{i}. {rec}\\n" for i, rec in enumerate(recommendations, 1))
 
 # Add comprehensive analysis insights
 trend_emoji = '📈' if metrics['overall_score'] >= 75 else '⚖️' if metrics['overall_score'] >= 60 else '📉'
 
-job_summary += f"""
+summary_parts.append(f"""
 
 ### 🔄 Comprehensive Analysis Insights
 
 {trend_emoji} **Sustainability Health Check:** 
-- **Analysis Duration:** {metadata['analysis_time']:.3f}s (Deep comprehensive scan)
+- **Analysis Duration:** {analysis_time}s (Deep comprehensive scan)
 - **Current Score:** **{metrics['overall_score']:.1f}/100**
 - **Quality Gate:** **{quality_gate_status}**
 - **Project Health:** **{get_score_status(metrics['overall_score'])}**
@@ -144,11 +145,14 @@ job_summary += f"""
 <div align="center">
 
 **🌱 Generated by Comprehensive Sustainability Evaluator** 
-*{metadata['generated_at'][:19]} • Advanced Analysis with Visualisations*
+*{generated_at} • Advanced Analysis with Visualisations*
  • [📈 All Analyses](../../actions)
 
 </div>
-"""
+""")
+
+# Join the sections once instead of growing one string with +=
+job_summary = ''.join(summary_parts)
 
 with open(os.environ['GITHUB_STEP_SUMMARY'], 'w') as f:
     f.write(job_summary)
@@ -19,6 +19,21 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import requests
 
+# GitHub primary language -> pipeline project type
+LANGUAGE_PROJECT_TYPES = {
+    'Python': 'python',
+    'JavaScript': 'javascript',
+    'TypeScript': 'javascript',
+    'Java': 'java',
+    'Go': 'go',
+    'C#': 'dotnet',
+    'PHP': 'php',
+    'Ruby': 'ruby',
+    'Rust': 'rust',
+    'C++': 'cpp',
+    'C': 'c'
+}
+
 class EnterpriseDeployer:
     def __init__(self, organization, template_type="enterprise", dry_run=False):
         self.org = organization
@@ -61,29 +76,11 @@ class EnterpriseDeployer:
     
     def detect_project_type(self, repo_info):
         """Map GitHub language to our project types"""
-        primary_language = repo_info.get('primaryLanguage')
-        
-        language_map = {
-            'Python': 'python',
-            'JavaScript': 'javascript',
-            'TypeScript': 'javascript',
-            'Java': 'java',
-            'Go': 'go',
-            'C#': 'dotnet',
-            'PHP': 'php',
-            'Ruby': 'ruby',
-            'Rust': 'rust',
-            'C++': 'cpp',
-            'C': 'c'
-        }
-        
-        detected_type = language_map.get(primary_language, 'mixed')
-        
         # Override with template type if specified
         if self.template != 'auto':
             return self.template
-            
-        return detected_type
+
+        return LANGUAGE_PROJECT_TYPES.get(repo_info.get('primaryLanguage'), 'mixed')
     
     def check_existing_sustainability_pipeline(self, repo_name):
         """Check if repository already has sustainability pipeline"""
@@ -8,6 +8,7 @@ import os
 import sys
 import json
 import argparse
+import contextlib
 import time
 from datetime import datetime
 from typing import Dict, List, Any, Optional
@@ -411,16 +412,18 @@ def main():
     parser = argparse.ArgumentParser(description='Sustainability Code Evaluation Analyzer')
     parser.add_argument('--path', default='.', help='Path to analyze (default: current directory)')
     parser.add_argument('--output', default='sustainability_analysis.json', 
-                       help='Output file for analysis results')
+                       help="Output file for analysis results ('-' writes JSON to stdout)")
     parser.add_argument('--config', help='Path to configuration file')
     parser.add_argument('--format', choices=['json', 'summary'], default='json',
                        help='Output format')
     
     args = parser.parse_args()
+    to_stdout = args.output == '-'
     
-    # Initialize and run analyzer
-    analyzer = SustainabilityAnalyzer(config_path=args.config)
-    result = analyzer.analyze_project(args.path)
+    # Initialize and run analyzer; progress goes to stderr when stdout carries the JSON
+    with contextlib.redirect_stdout(sys.stderr) if to_stdout else contextlib.nullcontext():
+        analyzer = SustainabilityAnalyzer(config_path=args.config)
+        result = analyzer.analyze_project(args.path)
     
     # Output results
     if args.format == 'json':
@@ -436,9 +439,12 @@ def main():
             'recommendations': result.recommendations
         }
         
-        with open(args.output, 'w') as f:
-            json.dump(output_data, f, indent=2)
-        print(f"Results saved to: {args.output}")
+        if to_stdout:
+            json.dump(output_data, sys.stdout, indent=2)
+        else:
+            with open(args.output, 'w') as f:
+                json.dump(output_data, f, indent=2)
+            print(f"Results saved to: {args.output}")
         
     elif args.format == 'summary':
         print(f"\nSUSTAINABILITY ANALYSIS SUMMARY")